@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from peewee import (CharField, DateField, FixedCharField, ForeignKeyField,
                     Model, SmallIntegerField, SqliteDatabase, TimeField)
@@ -53,10 +53,14 @@ def create_tables() -> None:
 def drop_tables() -> None:
     db.drop_tables(_MODELS)
 
-def init_db(db_name) -> None:
+def init_db(db_name,
+            pragmas: Optional[Dict[str, Any]] = None,
+            in_memory: bool = False
+        ) -> None:
     global _DB_NAME
     _DB_NAME = db_name
-    db.init(get_db_filename(_DB_NAME))
+    path = ":memory:" if in_memory else get_db_filename(_DB_NAME)
+    db.init(path, pragmas=pragmas)
     create_tables()
 
 def get_db_name() -> str:
@@ -1,5 +1,6 @@
 import logging
 import re
+import sqlite3
 from datetime import date, datetime, time
 from typing import Any, Callable, Iterable, Optional, Type
 
@@ -15,6 +16,23 @@ from deepfield.scraping.pages import InsertablePage, Link, Page
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+def _get_sqlite_max_variables() -> int:
+    """Returns the most bound variables the linked SQLite allows per
+    statement.
+    """
+    conn = sqlite3.connect(":memory:")
+    try:
+        if hasattr(conn, "getlimit"): # Python 3.11+
+            return conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    finally:
+        conn.close()
+    # compile-time defaults: 999 before SQLite 3.32, 32766 since
+    if sqlite3.sqlite_version_info >= (3, 32, 0):
+        return 32766
+    return 999
+
+_SQLITE_MAX_VARIABLES = _get_sqlite_max_variables()
+
 class MissingPlayDataError(ValueError):
     pass
 
@@ -62,6 +80,31 @@ class BBRefLink(Link):
         record = self._link_model.get_or_none(expr)
         return record is not None
 
+    @classmethod
+    def get_existing(cls, links: Iterable[Link]) -> set[Link]:
+        """Returns the subset of the given links whose pages already exist in
+        the database. This issues a query per model (per batch of name_ids)
+        rather than a query per link.
+        """
+        model_to_links: dict[Type[DeepFieldModel], dict[str, list[Link]]] = {}
+        for link in links:
+            if not isinstance(link, BBRefLink):
+                raise TypeError(f"{link} is not a BBRefLink")
+            if link._link_model is None:
+                raise TypeError("Model not defined for this link")
+            nid_to_links = model_to_links.setdefault(link._link_model, {})
+            nid_to_links.setdefault(link.name_id, []).append(link)
+        existing: set[Link] = set()
+        for model, nid_to_links in model_to_links.items():
+            for nids in chunked(nid_to_links, _SQLITE_MAX_VARIABLES):
+                query = (model
+                         .select(model.name_id)
+                         .where(model.name_id.in_(nids))
+                         .tuples())
+                for nid, in query:
+                    existing.update(nid_to_links[nid])
+        return existing
+
     __PLAYER_NAME_ID_MATCHER = re.compile(r"^[\w\.']+\d\d$")
     __GAME_NAME_ID_MATCHER   = re.compile(r"[A-Z0-9]{3}\d{9}")
 
@@ -197,7 +240,7 @@ class _PlaceholderTable(BeautifulSoup):
             table_contents = ph_div.next_sibling.next_sibling
         except AttributeError:
             raise MissingPlayDataError
-        super().__init__(table_contents, "html.parser")
+        super().__init__(table_contents, "lxml")
 
 class _PlaceholderDivFilter:
     """Matches placeholder divs whose comment of interest contains the
@@ -314,14 +357,21 @@ class _PlayerTable(_PlaceholderTable):
         return self.__name_to_db_ids[player_name] # type: ignore
 
     def __init_name_to_db_ids(self) -> None:
-        self.__name_to_db_ids = {}
-        for n, nid in self.get_name_name_ids():
-            if n not in self.__name_to_db_ids:
-                self.__name_to_db_ids[n] = []
-            db_player = Player.get(Player.name_id == nid)
-            self.__name_to_db_ids[n].append(db_player.id)
+        n_nids = self.get_name_name_ids()
+        # fetch all of the table's IDs in one query as plain tuples, rather
+        # than instantiating a Player model per row
+        query = (Player
+                 .select(Player.name_id, Player.id)
+                 .where(Player.name_id.in_([nid for _, nid in n_nids]))
+                 .tuples())
+        nid_to_db_id = dict(query)
+        name_to_db_ids: dict[str, list[int]] = {}
+        for n, nid in n_nids:
+            if n not in name_to_db_ids:
+                name_to_db_ids[n] = []
+            name_to_db_ids[n].append(nid_to_db_id[nid])
         self.__name_to_db_ids = {name: tuple(ids)
-                                 for name, ids in self.__name_to_db_ids.items()}
+                                 for name, ids in name_to_db_ids.items()}
 
     def __get_rows(self):
         if self.__rows is None:
@@ -512,7 +562,8 @@ class _GameQueryRunner:
 
 class _PlayQueryRunner:
 
-    __ROWS_PER_BATCH = 100
+    # Each inserted play binds one variable per non-ID field.
+    __ROWS_PER_BATCH = _SQLITE_MAX_VARIABLES // (len(Play._meta.sorted_fields) - 1)
 
     # Home team gets to bat last, i.e. in second half of inning (b).
     INNING_AND_PLAYER_TO_SIDE: dict[tuple[str, str], str] = {
@@ -1,7 +1,9 @@
 import logging
+from typing import Type
 
 from deepfield.scraping.bbref_pages import MissingPlayDataError
-from deepfield.scraping.pages import BBREF_CRAWL_DELAY, InsertablePage, Page
+from deepfield.scraping.pages import (BBREF_CRAWL_DELAY, InsertablePage, Link,
+                                      Page)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -9,17 +11,24 @@ logger.setLevel(logging.INFO)
 class ScrapeNode:
     """A node in the page dependency graph. The nodes are traversed via DFS."""
 
+    # Maps each page class to the node class used for it, filled in the first
+    # time a page of that class is seen.
+    __NODE_TYPES: dict[Type[Page], Type["ScrapeNode"]] = {}
+
     @classmethod
     def from_page(cls, page: Page):
         """Factory method to create proper ScrapeNode subclass from page. Use
         this over the constructor.
         """
-        new_node: ScrapeNode
-        if isinstance(page, InsertablePage):
-            new_node = InsertableScrapeNode(page)
-        else:
-            new_node = ScrapeNode(page)
-        return new_node
+        page_type = type(page)
+        node_type = ScrapeNode.__NODE_TYPES.get(page_type)
+        if node_type is None:
+            if isinstance(page, InsertablePage):
+                node_type = InsertableScrapeNode
+            else:
+                node_type = ScrapeNode
+            ScrapeNode.__NODE_TYPES[page_type] = node_type
+        return node_type(page)
 
     def __init__(self, page: Page):
         self._page = page
@@ -28,24 +37,51 @@ class ScrapeNode:
         """Scrapes the page corresponding to this node. Returns the total
         number of pages that were scraped during the process.
         """
-        logger.info(f"Starting scrape for {self._page}")
-        num_scraped = self._visit_children(crawl_delay)
-        logger.info(f"Finished scraping {self._page}")
-        return num_scraped + 1
-
-    def _visit_children(self, crawl_delay) -> int:
-        num_scraped = 0
-        for link in self._page.get_links():
-            if link.exists_in_db():
+        # The DFS is driven by an explicit stack rather than recursion. A node
+        # is exited once all of its children have been popped off the stack.
+        stack = [_ScrapeFrame(self)]
+        while True:
+            frame = stack[-1]
+            link = next(frame.links, None)
+            if link is not None:
+                try:
+                    page = Page.from_link(link, crawl_delay)
+                    stack.append(_ScrapeFrame(ScrapeNode.from_page(page)))
+                except Exception:
+                    logger.exception(f"Could not scrape {link}, skipping.")
                 continue
+            stack.pop()
+            if len(stack) == 0:
+                # failures at the root are left for the caller to handle
+                frame.node._exit()
+                return frame.num_scraped + 1
             try:
-                page = Page.from_link(link, crawl_delay)
-                num_scraped += ScrapeNode.from_page(page).scrape(crawl_delay)
+                frame.node._exit()
+                stack[-1].num_scraped += frame.num_scraped + 1
             except MissingPlayDataError:
-                logger.warning(f"{page} is missing play data, skipping.")
+                logger.warning(f"{frame.node._page} is missing play data, skipping.")
             except Exception:
-                logger.exception(f"Could not scrape {page}, skipping.")
-        return num_scraped
+                logger.exception(f"Could not scrape {frame.node._page}, skipping.")
+
+    def _enter(self) -> None:
+        """Called when the traversal first reaches this node."""
+        logger.info(f"Starting scrape for {self._page}")
+
+    def _exit(self) -> None:
+        """Called once all of this node's children have been visited."""
+        logger.info(f"Finished scraping {self._page}")
+
+    def _get_new_links(self) -> list[Link]:
+        """Returns the page's links that don't already exist in the database."""
+        links = list(dict.fromkeys(self._page.get_links()))
+        # each link type checks its own links, so it can do so in bulk
+        type_to_links: dict[Type[Link], list[Link]] = {}
+        for link in links:
+            type_to_links.setdefault(type(link), []).append(link)
+        existing: set[Link] = set()
+        for link_type, typed_links in type_to_links.items():
+            existing.update(link_type.get_existing(typed_links))
+        return [link for link in links if link not in existing]
 
 class InsertableScrapeNode(ScrapeNode):
     """A node in the page dependency graph that performs database insertion
@@ -55,8 +91,20 @@ class InsertableScrapeNode(ScrapeNode):
     def __init__(self, page: InsertablePage):
         self._page = page
 
-    def scrape(self, crawl_delay = BBREF_CRAWL_DELAY) -> int:
-        num_scraped = self._visit_children(crawl_delay)
+    def _enter(self) -> None:
+        pass
+
+    def _exit(self) -> None:
         self._page.update_db() # type: ignore
         logger.info(f"Finished scraping {self._page}")
-        return num_scraped + 1
+
+class _ScrapeFrame:
+    """A node on the scrape stack, along with the child links it has yet to
+    visit and the number of pages scraped beneath it so far.
+    """
+
+    def __init__(self, node: ScrapeNode):
+        node._enter()
+        self.node = node
+        self.links = iter(node._get_new_links())
+        self.num_scraped = 0
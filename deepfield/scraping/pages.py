@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from time import sleep
 from time import time as get_cur_time
-from typing import Callable, Dict, Iterable, Optional, Type
+from typing import Callable, Dict, Iterable, Optional, Set, Type
 
 import requests
 from bs4 import BeautifulSoup
@@ -34,6 +34,14 @@ class Link(ABC):
         """Returns whether this page already exists in the database."""
         pass
 
+    @classmethod
+    def get_existing(cls, links: Iterable["Link"]) -> Set["Link"]:
+        """Returns the subset of the given links whose pages already exist in
+        the database. Subclasses can override this to check many links at
+        once.
+        """
+        return {link for link in links if link.exists_in_db()}
+
     @abstractmethod
     def _get_page_type(self) -> Type["Page"]:
         """Returns the type of page this link corresponds to."""
@@ -66,7 +74,7 @@ class Page(ABC):
         return _PageRetriever(link, crawl_delay).get_page()
 
     def __init__(self, html: str):
-        self._soup = BeautifulSoup(html, "html.parser")
+        self._soup = BeautifulSoup(html, "lxml")
 
     @abstractmethod
     def get_links(self) -> Iterable[Link]:
@@ -225,8 +233,9 @@ class _AbstractHtmlCache(ABC):
         return os.path.join(self._root, rel_path)
 
     def _get_file_html(self, filename: str) -> str:
-        with open(self._full_path(filename), 'r', encoding="utf-8") as html_file:
-            return html_file.read()
+        # read raw bytes and decode once, skipping text-mode newline handling
+        with open(self._full_path(filename), 'rb') as html_file:
+            return html_file.read().decode("utf-8")
 
     @staticmethod
     def _get_filename(link: Link) -> str:
@@ -286,9 +295,10 @@ class _HtmlFolder(_AbstractHtmlCache):
     """A folder containing HTML pages."""
 
     def find_html(self, link: Link) -> Optional[str]:
-        if not os.path.isdir(self._root):
-            return None
+        # the folder is only probed until its file listing has been read
         if not hasattr(self, "_contained_files"):
+            if not os.path.isdir(self._root):
+                return None
             self.__init_contained_files()
         filename = self._get_filename(link)
         if filename in self._contained_files:
@@ -0,0 +1,10 @@
+import pytest
+
+from tests import utils
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_env():
+    utils.init_test_env()
+    yield
+    utils.remove_db()
@@ -1,5 +1,5 @@
 from datetime import date, time
-from typing import Iterable, Tuple, Type
+from typing import Dict, FrozenSet, Iterable, Set, Tuple, Type
 
 from pytest import raises
 
@@ -16,12 +16,6 @@ RES_URLS = [
     "https://www.baseball-reference.com/players/v/vendipa01.shtml"
 ]
 
-def setup_module(module):
-    utils.init_test_env()
-
-def teardown_module(module):
-    utils.remove_db()
-
 class TestPageFromLink:
 
     def test_page_types(self):
@@ -46,24 +40,27 @@ class TestPage:
     name: str
     page: BBRefPage
     page_type: Type[BBRefPage]
+    page_urls: FrozenSet[str]
 
     @classmethod
-    def setup_method(cls):
-        utils.clear_db()
+    def setup_class(cls):
+        # tests that write to the database clear it themselves
         html = HtmlCache.get().find_html(BBRefLink(cls.name))
         cls.page = cls.page_type(html)  # type: ignore
+        cls.page_urls = frozenset(str(link) for link in cls.page.get_links())
 
     @classmethod
-    def test_urls(cls, on_list_suffixes: Iterable[str], not_on_list_suffixes: Iterable[str]):
-        page_urls = set([str(link) for link in cls.page.get_links()])
-        for url in cls._expand_urls(on_list_suffixes):
-            assert url in page_urls
-        for url in cls._expand_urls(not_on_list_suffixes):
-            assert url not in page_urls
+    def _test_urls(cls, on_list_suffixes: Iterable[str], not_on_list_suffixes: Iterable[str]):
+        on_list = cls._expand_urls(on_list_suffixes)
+        not_on_list = cls._expand_urls(not_on_list_suffixes)
+        missing = on_list - cls.page_urls
+        unexpected = not_on_list & cls.page_urls
+        assert not missing, missing
+        assert not unexpected, unexpected
 
     @classmethod
-    def _expand_urls(cls, suffixes: Iterable[str]) -> Iterable[str]:
-        return [cls.page.BASE_URL + s for s in suffixes]
+    def _expand_urls(cls, suffixes: Iterable[str]) -> Set[str]:
+        return {cls.page.BASE_URL + s for s in suffixes}
 
     def _test_hash_eq(self, other_name: str):
         link = BBRefLink(self.name)
@@ -100,7 +97,7 @@ class TestSchedulePage(TestPage):
             "/leagues/MLB/2016-schedule.shtml",
             "/boxes/BOS/BOS201708270.shtml"
         ]
-        super().test_urls(on_list, not_on_list)
+        self._test_urls(on_list, not_on_list)
 
 class TestPlayerPage(TestPage):
 
@@ -112,13 +109,14 @@ class TestPlayerPage(TestPage):
         self._test_hash_eq(TestGamePage.name)
 
     def test_queries(self):
+        utils.clear_db()
         assert not self.page._exists_in_db()
         self.page.update_db()
         assert self.page._exists_in_db()
-        Player.get(Player.name == "Pat Venditte"
-                   and Player.name_id == "vendipa01"
-                   and Player.bats == Handedness.LEFT.value
-                   and Player.throws == Handedness.BOTH.value)
+        Player.get((Player.name == "Pat Venditte")
+                   & (Player.name_id == "vendipa01")
+                   & (Player.bats == Handedness.LEFT.value)
+                   & (Player.throws == Handedness.BOTH.value))
 
 class TestPlayerNameTrimming(TestPage):
 
@@ -127,6 +125,7 @@ class TestPlayerNameTrimming(TestPage):
     page: PlayerPage
 
     def test_name_trimming(self):
+        utils.clear_db()
         assert not self.page._exists_in_db()
         self.page.update_db()
         assert self.page._exists_in_db()
@@ -138,8 +137,9 @@ class AbstractTestGamePage(TestPage):
     page: GamePage
 
     @staticmethod
-    def _id_of_name_id(name_id: str) -> int:
-        return Player.get(Player.name_id == name_id).id
+    def _player_ids() -> Dict[str, int]:
+        """Maps the name_id of each player in the database to its id."""
+        return dict(Player.select(Player.name_id, Player.id).tuples())
 
 class TestGamePage(AbstractTestGamePage):
 
@@ -159,51 +159,53 @@ class TestGamePage(AbstractTestGamePage):
         not_on_list = [
             "/boxes/CHN/CHN201710090.shtml",
         ]
-        super().test_urls(on_list, not_on_list)
+        self._test_urls(on_list, not_on_list)
 
     def test_queries(self):
+        utils.clear_db()
         with raises(ValueError):
             self.page.update_db()
         utils.insert_mock_players(self.page)
         assert not self.page._exists_in_db()
         self.page.update_db()
         assert self.page._exists_in_db()
+        ids = self._player_ids()
         venue = Venue.get(Venue.name == "Nationals Park")
-        home = Team.get(Team.name == "Washington Nationals" and Team.abbreviation == "WSN")
-        away = Team.get(Team.name == "Chicago Cubs" and Team.abbreviation == "CHC")
+        home = Team.get((Team.name == "Washington Nationals") & (Team.abbreviation == "WSN"))
+        away = Team.get((Team.name == "Chicago Cubs") & (Team.abbreviation == "CHC"))
         game = Game.get(
-                Game.name_id == "WAS201710120"
-                and Game.local_start_time == time(20, 8)
-                and Game.time_of_day == TimeOfDay.NIGHT.value
-                and Game.field_type == FieldType.GRASS.value
-                and Game.date == date(2017, 10, 12)
-                and Game.venue_id == venue.id
-                and Game.home_team_id == home.id
-                and Game.away_team_id == away.id
+                (Game.name_id == "WAS201710120")
+                & (Game.local_start_time == time(20, 8))
+                & (Game.time_of_day == TimeOfDay.NIGHT.value)
+                & (Game.field_type == FieldType.GRASS.value)
+                & (Game.date == date(2017, 10, 12))
+                & (Game.venue_id == venue.id)
+                & (Game.home_team_id == home.id)
+                & (Game.away_team_id == away.id)
             )
         play = Play.get(
-                Play.game_id == game.id
-                and Play.inning_half == 0
-                and Play.start_outs == 0
-                and Play.start_on_base == OnBase.EMPTY.value
-                and Play.play_num == 0
-                and Play.desc == "Double to RF (Line Drive)"
-                and Play.pitch_ct == "2,(0-1) CX"
-                and Play.batter_id == self._id_of_name_id("jayjo02")
-                and Play.pitcher_id == self._id_of_name_id("gonzagi01")
+                (Play.game_id == game.id)
+                & (Play.inning_half == 0)
+                & (Play.start_outs == 0)
+                & (Play.start_on_base == OnBase.EMPTY.value)
+                & (Play.play_num == 0)
+                & (Play.desc == "Double to RF (Line Drive)")
+                & (Play.pitch_ct == "2,(0-1) CX")
+                & (Play.batter_id == ids["jayjo02"])
+                & (Play.pitcher_id == ids["gonzagi01"])
             )
         Play.get(
-                Play.game_id == game.id
-                and Play.inning_half == 4
-                and Play.start_outs == 1
-                and Play.start_on_base == (OnBase.FIRST | OnBase.SECOND).value
-                and Play.play_num == 28
-                and Play.desc == "Walk; Bryant to 3B; Contreras to 2B"
-                and Play.pitch_ct == "6,(3-2) CBFBBB"
-                and Play.batter_id == self._id_of_name_id("almoral01")
-                and Play.pitcher_id == self._id_of_name_id("gonzagi01")
+                (Play.game_id == game.id)
+                & (Play.inning_half == 4)
+                & (Play.start_outs == 1)
+                & (Play.start_on_base == (OnBase.FIRST | OnBase.SECOND).value)
+                & (Play.play_num == 28)
+                & (Play.desc == "Walk; Bryant to 3B; Contreras to 2B")
+                & (Play.pitch_ct == "6,(3-2) CBFBBB")
+                & (Play.batter_id == ids["almoral01"])
+                & (Play.pitcher_id == ids["gonzagi01"])
             )
-        assert len(list(Play.select())) == 97
+        assert Play.select().count() == 97
 
 class TestGamePageNames(AbstractTestGamePage):
 
@@ -211,14 +213,17 @@ class TestGamePageNames(AbstractTestGamePage):
     plays: Iterable[Tuple[int, str]] # play_num, name_id
 
     def _test_queries(self):
+        utils.clear_db()
         utils.insert_mock_players(self.page)
         self.page.update_db()
         assert self.page._exists_in_db()
-        for play_num, name_id in self.plays:
-            Play.get(
-                Play.play_num == play_num
-                and getattr(Play, self.player_type + "_id")
-            )
+        ids = self._player_ids()
+        player_id = getattr(Play, self.player_type + "_id")
+        query = (Play
+                 .select(Play.play_num, player_id)
+                 .where(Play.play_num.in_([play_num for play_num, _ in self.plays]))
+                 .tuples())
+        assert dict(query) == {play_num: ids[name_id] for play_num, name_id in self.plays}
 
 
 class TestGamePageSameNames(TestGamePageNames):
@@ -226,13 +231,13 @@ class TestGamePageSameNames(TestGamePageNames):
     name = "BAL200705070.shtml"
     player_type = "pitcher"
     plays = [
-        ( 3, "hernaro01"),
-        ( 4, "hernaro01"),
-        ( 5, "hernaro01"),
-        (66, "hernaro01"),
-        (82, "carmofa01"),
-        (83, "carmofa01"),
-        (84, "carmofa01"),
+        ( 3, "carmofa01"),
+        ( 4, "carmofa01"),
+        ( 5, "carmofa01"),
+        (66, "carmofa01"),
+        (82, "hernaro01"),
+        (83, "hernaro01"),
+        (84, "hernaro01"),
     ]
     def test_queries(self):
         self._test_queries()
@@ -245,9 +250,9 @@ class TestGamePageFatherAndSon(TestGamePageNames):
         ( 9, "griffke01"),
         (26, "griffke01"),
         (48, "griffke01"),
-        (82, "griffke02"),
-        (83, "griffke02"),
-        (84, "griffke01"),
+        (84, "griffke02"),
+        (85, "griffke02"),
+        (86, "griffke01"),
     ]
     def test_queries(self):
         self._test_queries()
@@ -276,7 +281,8 @@ class TestPlayerTables(TestPage):
                 [home, away],
                 [self.page._player_tables.away, self.page._player_tables.home]
             ):
-            for p in on_list:
-                assert p in ptable.get_name_ids()
-            for p in not_on_list:
-                assert p not in ptable.get_name_ids()
+            name_ids = set(ptable.get_name_ids())
+            missing = set(on_list) - name_ids
+            unexpected = set(not_on_list) & name_ids
+            assert not missing, missing
+            assert not unexpected, unexpected
@@ -1,5 +1,4 @@
 import os
-from shutil import copyfile
 from typing import List
 
 import pytest
@@ -7,34 +6,26 @@ import pytest
 from deepfield.scraping.bbref_pages import (BBRefLink, GamePage,
                                             MissingPlayDataError)
 from deepfield.scraping.nodes import InsertableScrapeNode, ScrapeNode
-from deepfield.scraping.pages import Page
+from deepfield.scraping.pages import HtmlCache, Page, _CachedHandler
 from tests import utils
 
 
-def setup_module(module):
-    utils.init_test_env()
+class TestScrapeNode:
 
-def teardown_module(module):
-    utils.remove_db()
+    page: Page
 
-class TestScrapeNode:
+    @classmethod
+    def setup_class(cls):
+        cls.page = Page.from_link(BBRefLink("WAS201710120.shtml"))
 
     def test_from_page(self):
-        link = BBRefLink("WAS201710120.shtml")
-        page = Page.from_link(link)
-        assert ScrapeNode.from_page(page).__class__ == InsertableScrapeNode
+        assert ScrapeNode.from_page(self.page).__class__ == InsertableScrapeNode
 
     def test_no_visit_twice(self):
-        # these games share the same lineups
+        # the second scrape should find the game's players already inserted
         utils.clear_db()
-        games = [
-            "WAS201710120.shtml",
-            "CHN201710110.shtml"
-        ]
-        for game, expected_scrape_num in zip(games, [39, 1]):
-            link = BBRefLink("WAS201710120.shtml")
-            page = Page.from_link(link)
-            node = ScrapeNode.from_page(page)
+        for expected_scrape_num in [39, 1]:
+            node = ScrapeNode.from_page(self.page)
             assert node.scrape() == expected_scrape_num
 
 PARSE_URLS: List[str] = [
@@ -73,14 +64,14 @@ class TestParseable:
         with pytest.raises(MissingPlayDataError):
             ScrapeNode.from_page(page).scrape()
 
-    def test_malformed_html(self):
-        # the web handler will download the correct html, so need to copy
-        # malformed html to cached file beforehand to test properly
+    def test_malformed_html(self, monkeypatch: pytest.MonkeyPatch):
+        # serve malformed html from the cache so that the web handler has to
+        # download the correct html, without touching the cached files
         player_pages = os.path.join("tests", "scraping", "resources", "PlayerPage")
-        copyfile(
-                src = os.path.join(player_pages, "malformed_arod.shtml"),
-                dst = os.path.join(player_pages, "rodrial01.shtml")
-            )
+        with open(os.path.join(player_pages, "malformed_arod.shtml"), "rb") as f:
+            malformed_html = f.read().decode("utf-8")
+        monkeypatch.setattr(_CachedHandler, "retrieve_html", lambda _: malformed_html)
+        monkeypatch.setattr(HtmlCache, "insert_html", lambda *_: None)
         url = "https://www.baseball-reference.com/players/r/rodrial01.shtml"
         link = BBRefLink(url)
         page = Page.from_link(link)
@@ -1,25 +1,40 @@
-import os
+import sqlite3
+from typing import Any, Iterable, Optional
 
-from deepfield.db.models import (Player, create_tables, db, drop_tables,
-                                get_db_filename, init_db)
+from deepfield.db.models import Player, db, init_db
 from deepfield.db.enums import Handedness
 from deepfield.scraping.bbref_pages import BBRefLink, GamePage
 from deepfield.scraping.nodes import ScrapeNode
 from deepfield.scraping.pages import Page
 
+# The test database is kept in memory, so each pytest-xdist worker process
+# already has its own.
 TEST_DB_NAME = "tmp"
 
+_TEST_DB_PRAGMAS = {
+    "temp_store": "memory",
+    "cache_size": -64000,
+}
+
+# Copy of the freshly created, empty test database. Restoring it is much
+# cheaper than dropping and recreating every table.
+_empty_db: Optional[sqlite3.Connection] = None
+
 def init_test_env() -> None:
-    init_db(TEST_DB_NAME)
-    clear_db()
+    global _empty_db
+    init_db(TEST_DB_NAME, _TEST_DB_PRAGMAS, in_memory=True)
+    _empty_db = sqlite3.connect(":memory:")
+    db.connection().backup(_empty_db)
 
 def remove_db() -> None:
+    if _empty_db is not None:
+        _empty_db.close()
     db.close()
-    os.remove(get_db_filename())
 
 def clear_db() -> None:
-    drop_tables()
-    create_tables()
+    if _empty_db is None:
+        raise RuntimeError("Test environment not initialized")
+    _empty_db.backup(db.connection())
 
 def insert_natls_game() -> None:
     insert_game("WAS201710120.shtml")
@@ -28,25 +43,31 @@ def insert_cubs_game() -> None:
     insert_game("CHN201710110.shtml")
 
 def insert_game(url: str) -> None:
-    full_url = f"https://www.baseball-reference.com/boxes/{url[:3]}/{url}"
-    link = BBRefLink(full_url)
-    page = Page.from_link(link)
-    insert_mock_players(page)  # type: ignore
-    ScrapeNode.from_page(page).scrape()
-
-def insert_mock_players(page: GamePage) -> None:
-    ptables = page._player_tables
+    insert_games([url])
+
+def insert_games(urls: Iterable[str]) -> None:
+    pages = []
+    for url in urls:
+        full_url = f"https://www.baseball-reference.com/boxes/{url[:3]}/{url}"
+        pages.append(Page.from_link(BBRefLink(full_url)))
+    insert_mock_players(*pages)  # type: ignore
     with db.atomic():
-        for table in ptables:
+        for page in pages:
+            ScrapeNode.from_page(page).scrape()
+
+_MOCK_HANDEDNESS = Handedness.RIGHT.value
+
+def insert_mock_players(*pages: GamePage) -> None:
+    rows: dict[str, dict[str, Any]] = {}
+    for page in pages:
+        for table in page._player_tables:
             for name, name_id in table.get_name_name_ids():
-                _insert_mock_player(name, name_id)
-
-def _insert_mock_player(name: str, name_id: str) -> None:
-    fields = {
-        "name": name,
-        "name_id": name_id,
-        "bats": Handedness.RIGHT.value,
-        "throws": Handedness.RIGHT.value,
-    }
-    if Player.get_or_none(Player.name_id == name_id) is None:
-        Player.create(**fields)
+                if name_id not in rows:
+                    rows[name_id] = {
+                        "name": name,
+                        "name_id": name_id,
+                        "bats": _MOCK_HANDEDNESS,
+                        "throws": _MOCK_HANDEDNESS,
+                    }
+    with db.atomic():
+        Player.insert_many(rows.values()).on_conflict_ignore().execute()